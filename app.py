@@ -5,6 +5,7 @@ import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime
 import warnings
+from utils.helpers import count_matrix, extract_top_items, load_netflix_csv, split_items
 warnings.filterwarnings('ignore')
 
 # Custom CSS and JS
@@ -37,26 +38,86 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load data
+# Columns the dashboard reads from the prepared dataset
+USED_COLS = ['type', 'title', 'director', 'cast', 'country', 'date_added', 'year_added',
+             'month_added', 'release_year', 'decade', 'rating', 'duration', 'duration_num',
+             'listed_in', 'description']
+
 @st.cache_data
 def load_data():
+    # Prefer the pre-cleaned Parquet file (see convert_data.py); dtypes are stored with it
     try:
-        df = pd.read_csv("netflix_titles.csv")
-        # Data cleaning
-        df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
-        df['year_added'] = df['date_added'].dt.year
-        df['month_added'] = df['date_added'].dt.month
-        df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
-        
-        # Handle missing values
-        df['country'] = df['country'].fillna('Unknown')
-        df['rating'] = df['rating'].fillna('Not Rated')
-        df['duration'] = df['duration'].fillna('Unknown')
-        
-        return df
+        return pd.read_parquet("netflix_titles.parquet", columns=USED_COLS)
+    except FileNotFoundError:
+        pass
+    
+    try:
+        return load_netflix_csv("netflix_titles.csv")[USED_COLS]
     except FileNotFoundError:
         st.error("❌ netflix_titles.csv file not found. Please ensure the file is in the same directory.")
         return pd.DataFrame()
 
+# Sidebar filter mask; cheap enough to recompute, so the filtered frame itself isn't cached
+def filter_data(df, filter_key):
+    content_type, ratings, year_range = filter_key
+    # Compare categorical codes and the raw year array instead of building Series masks
+    type_codes = np.flatnonzero(df['type'].cat.categories.isin(content_type))
+    rating_codes = np.flatnonzero(df['rating'].cat.categories.isin(ratings))
+    mask = np.isin(df['type'].cat.codes.to_numpy(), type_codes)
+    mask &= np.isin(df['rating'].cat.codes.to_numpy(), rating_codes)
+    years = df['release_year'].to_numpy()
+    mask &= (years >= year_range[0]) & (years <= year_range[1])
+    return df[mask]
+
+# Cached per-filter tables, keyed on the hashable filter tuple. The already-filtered
+# frame is passed as an unhashed _filtered_df argument so a cache miss doesn't copy the
+# full dataset. Bounded so each new slider/multiselect combination doesn't stay forever
+FILTER_CACHE_ENTRIES = 32
+
+# Genre/country explosions don't depend on the filters: build them once as
+# (row index, value) tables and select rows by the filtered index per rerun
+@st.cache_data
+def exploded_genres():
+    return split_items(load_data()['listed_in']).rename('genre').reset_index()
+
+@st.cache_data
+def exploded_countries():
+    countries = load_data()['country'].dropna()
+    return split_items(countries[countries != 'Unknown']).reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def compute_genre_table(filter_key, _filtered_df):
+    # One row per (title, genre) with the title's release year, shared by the genres tab
+    genres = exploded_genres()
+    genres = genres[genres['index'].isin(_filtered_df.index)]
+    return genres.join(_filtered_df[['release_year']], on='index')
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def compute_genre_counts(filter_key, _filtered_df):
+    return compute_genre_table(filter_key, _filtered_df)['genre'].value_counts().head(15)
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def compute_country_table(filter_key, _filtered_df):
+    # One row per (title, country) with the title's type and rating, shared by the geography tab
+    countries = exploded_countries()
+    countries = countries[countries['index'].isin(_filtered_df.index)]
+    return countries.join(_filtered_df[['type', 'rating']], on='index')
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def compute_country_counts(filter_key, _filtered_df):
+    return compute_country_table(filter_key, _filtered_df)['country'].value_counts().head(20)
+
+# Selectbox options depend only on the raw data, so compute them once
+@st.cache_data
+def unique_genres():
+    genres = split_items(load_data()['listed_in'])
+    return sorted(genres[genres != ''].unique())
+
+@st.cache_data
+def unique_countries():
+    countries = split_items(load_data()['country'])
+    return sorted(countries[countries != ''].unique())
+
 # Load the data
 df = load_data()
 
@@ -74,15 +135,15 @@ st.sidebar.markdown("""
 st.sidebar.markdown("### Content Type")
 content_type = st.sidebar.multiselect(
     "Select content type:",
-    options=df['type'].unique(),
-    default=df['type'].unique()
+    options=list(df['type'].unique()),
+    default=list(df['type'].unique())
 )
 
 st.sidebar.markdown("### Rating")
 ratings = st.sidebar.multiselect(
     "Select ratings:",
-    options=df['rating'].unique(),
-    default=df['rating'].unique()
+    options=list(df['rating'].unique()),
+    default=list(df['rating'].unique())
 )
 
 st.sidebar.markdown("### Release Year Range")
@@ -94,12 +155,13 @@ year_range = st.sidebar.slider(
 )
 
 # Apply filters
-filtered_df = df[
-    (df['type'].isin(content_type)) &
-    (df['rating'].isin(ratings)) &
-    (df['release_year'] >= year_range[0]) &
-    (df['release_year'] <= year_range[1])
-]
+filter_key = (tuple(content_type), tuple(ratings), tuple(year_range))
+filtered_df = filter_data(df, filter_key)
+
+# Movie mask computed once and reused by the metrics and the Overview tab
+is_movie = (filtered_df['type'] == 'Movie').to_numpy()
+n_movies = int(is_movie.sum())
+n_tv_shows = len(filtered_df) - n_movies
 
 # Main content
 col1, col2, col3, col4 = st.columns(4)
@@ -107,9 +169,9 @@ col1, col2, col3, col4 = st.columns(4)
 with col1:
     st.metric("Total Content", len(filtered_df))
 with col2:
-    st.metric("Movies", len(filtered_df[filtered_df['type'] == 'Movie']))
+    st.metric("Movies", n_movies)
 with col3:
-    st.metric("TV Shows", len(filtered_df[filtered_df['type'] == 'TV Show']))
+    st.metric("TV Shows", n_tv_shows)
 with col4:
     latest_year = filtered_df['release_year'].max()
     st.metric("Latest Release Year", int(latest_year) if not pd.isna(latest_year) else "N/A")
@@ -123,7 +185,10 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "🔍 Detailed Analysis"
 ])
 
-with tab1:
+# Each tab renders inside its own fragment, so widget interactions in one tab
+# rerun only that tab instead of rebuilding every figure in the script
+@st.fragment
+def render_overview():
     st.markdown("### Content Distribution Overview")
     
     col1, col2 = st.columns(2)
@@ -131,6 +196,7 @@ with tab1:
     with col1:
         # Content type distribution
         type_counts = filtered_df['type'].value_counts()
+        type_counts = type_counts[type_counts > 0]  # Categoricals keep unselected types
         fig_type = px.pie(
             values=type_counts.values,
             names=type_counts.index,
@@ -138,11 +204,12 @@ with tab1:
             color_discrete_sequence=px.colors.sequential.RdBu
         )
         fig_type.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_type, use_container_width=True)
+        st.plotly_chart(fig_type, use_container_width=True, key="fig_type")
     
     with col2:
         # Rating distribution
-        rating_counts = filtered_df['rating'].value_counts().head(10)
+        rating_counts = filtered_df['rating'].value_counts()
+        rating_counts = rating_counts[rating_counts > 0].head(10)
         fig_rating = px.bar(
             x=rating_counts.values,
             y=rating_counts.index,
@@ -152,13 +219,12 @@ with tab1:
             color_continuous_scale='Viridis'
         )
         fig_rating.update_layout(xaxis_title="Count", yaxis_title="Rating")
-        st.plotly_chart(fig_rating, use_container_width=True)
+        st.plotly_chart(fig_rating, use_container_width=True, key="fig_rating")
     
     # New: Donut chart for content over decades
     st.markdown("### Content Distribution by Decades")
     
-    # Create decades
-    filtered_df['decade'] = (filtered_df['release_year'] // 10) * 10
+    # Decades are derived once at load
     decade_counts = filtered_df['decade'].value_counts().sort_index()
     
     col1, col2 = st.columns(2)
@@ -171,11 +237,11 @@ with tab1:
             hole=0.4
         )
         fig_decade.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_decade, use_container_width=True)
+        st.plotly_chart(fig_decade, use_container_width=True, key="fig_decade")
     
     with col2:
         # Stacked bar chart for type distribution by decade
-        decade_type = pd.crosstab(filtered_df['decade'], filtered_df['type'])
+        decade_type = count_matrix(filtered_df['decade'], filtered_df['type'])
         fig_decade_type = px.bar(
             decade_type,
             x=decade_type.index,
@@ -184,38 +250,33 @@ with tab1:
             barmode='stack'
         )
         fig_decade_type.update_layout(xaxis_title="Decade", yaxis_title="Count")
-        st.plotly_chart(fig_decade_type, use_container_width=True)
+        st.plotly_chart(fig_decade_type, use_container_width=True, key="fig_decade_type")
     
     # Duration analysis
     st.markdown("### Duration Analysis")
     
     # Separate movies and TV shows for duration analysis
-    movies_df = filtered_df[filtered_df['type'] == 'Movie'].copy()
-    tv_shows_df = filtered_df[filtered_df['type'] == 'TV Show'].copy()
-    
-    # Extract duration for movies
-    movies_df['duration_min'] = movies_df['duration'].str.extract('(\d+)').astype(float)
-    
-    # Extract seasons for TV shows
-    tv_shows_df['seasons'] = tv_shows_df['duration'].str.extract('(\d+)').astype(float)
+    # duration_num is parsed once at load: minutes for movies, seasons for TV shows
+    movies_df = filtered_df.loc[is_movie]
+    tv_shows_df = filtered_df.loc[~is_movie]
     
     col1, col2 = st.columns(2)
     
     with col1:
-        if not movies_df.empty and 'duration_min' in movies_df.columns:
+        if not movies_df.empty:
             fig_movie_duration = px.histogram(
                 movies_df, 
-                x='duration_min',
+                x='duration_num',
                 title="Movie Duration Distribution (minutes)",
                 nbins=30,
                 color_discrete_sequence=['#E50914']
             )
             fig_movie_duration.update_layout(xaxis_title="Duration (minutes)", yaxis_title="Count")
-            st.plotly_chart(fig_movie_duration, use_container_width=True)
+            st.plotly_chart(fig_movie_duration, use_container_width=True, key="fig_movie_duration")
     
     with col2:
-        if not tv_shows_df.empty and 'seasons' in tv_shows_df.columns:
-            season_counts = tv_shows_df['seasons'].value_counts().sort_index().head(15)
+        if not tv_shows_df.empty:
+            season_counts = tv_shows_df['duration_num'].value_counts().sort_index().head(15)
             fig_tv_seasons = px.bar(
                 x=season_counts.index,
                 y=season_counts.values,
@@ -224,17 +285,17 @@ with tab1:
                 color_continuous_scale='Plasma'
             )
             fig_tv_seasons.update_layout(xaxis_title="Number of Seasons", yaxis_title="Count")
-            st.plotly_chart(fig_tv_seasons, use_container_width=True)
+            st.plotly_chart(fig_tv_seasons, use_container_width=True, key="fig_tv_seasons")
 
-with tab2:
+with tab1:
+    render_overview()
+
+@st.fragment
+def render_genres():
     st.markdown("### Genre Analysis")
     
     # Genre analysis
-    all_genres = []
-    for genres in filtered_df['listed_in'].dropna():
-        all_genres.extend([genre.strip() for genre in genres.split(',')])
-    
-    genre_counts = pd.Series(all_genres).value_counts().head(15)
+    genre_counts = compute_genre_counts(filter_key, filtered_df)
     
     col1, col2 = st.columns(2)
     
@@ -248,7 +309,7 @@ with tab2:
             color_continuous_scale='Teal'
         )
         fig_genres.update_layout(xaxis_title="Count", yaxis_title="Genre")
-        st.plotly_chart(fig_genres, use_container_width=True)
+        st.plotly_chart(fig_genres, use_container_width=True, key="fig_genres")
     
     with col2:
         # Genre treemap
@@ -258,25 +319,14 @@ with tab2:
             values=genre_counts.values,
             title="Genre Distribution (Treemap)"
         )
-        st.plotly_chart(fig_genre_treemap, use_container_width=True)
+        st.plotly_chart(fig_genre_treemap, use_container_width=True, key="fig_genre_treemap")
     
     # New: Genre over time
     st.markdown("### Genre Trends Over Time")
     
     # Extract genres and create genre-time analysis
-    genre_time_data = []
-    for idx, row in filtered_df.iterrows():
-        if pd.notna(row['listed_in']):
-            genres = [genre.strip() for genre in row['listed_in'].split(',')]
-            for genre in genres:
-                if genre in genre_counts.head(8).index:  # Top 8 genres
-                    genre_time_data.append({
-                        'genre': genre,
-                        'release_year': row['release_year'],
-                        'type': row['type']
-                    })
-    
-    genre_time_df = pd.DataFrame(genre_time_data)
+    genre_table = compute_genre_table(filter_key, filtered_df)
+    genre_time_df = genre_table[genre_table['genre'].isin(genre_counts.head(8).index)]  # Top 8 genres
     
     if not genre_time_df.empty:
         genre_year_counts = genre_time_df.groupby(['release_year', 'genre']).size().reset_index(name='count')
@@ -290,18 +340,14 @@ with tab2:
             markers=True
         )
         fig_genre_trend.update_layout(xaxis_title="Release Year", yaxis_title="Number of Titles")
-        st.plotly_chart(fig_genre_trend, use_container_width=True)
+        st.plotly_chart(fig_genre_trend, use_container_width=True, key="fig_genre_trend")
     
     # Director and Cast analysis
     col1, col2 = st.columns(2)
     
     with col1:
         # Director analysis
-        all_directors = []
-        for directors in filtered_df['director'].dropna():
-            all_directors.extend([director.strip() for director in directors.split(',')])
-        
-        director_counts = pd.Series(all_directors).value_counts().head(10)
+        director_counts = extract_top_items(filtered_df['director'], 10)
         
         fig_directors = px.bar(
             x=director_counts.values,
@@ -312,15 +358,11 @@ with tab2:
             color_continuous_scale='Rainbow'
         )
         fig_directors.update_layout(xaxis_title="Number of Titles", yaxis_title="Director")
-        st.plotly_chart(fig_directors, use_container_width=True)
+        st.plotly_chart(fig_directors, use_container_width=True, key="fig_directors")
     
     with col2:
         # Cast analysis
-        all_cast = []
-        for cast in filtered_df['cast'].dropna():
-            all_cast.extend([actor.strip() for actor in cast.split(',')])
-        
-        cast_counts = pd.Series(all_cast).value_counts().head(10)
+        cast_counts = extract_top_items(filtered_df['cast'], 10)
         
         fig_cast = px.bar(
             x=cast_counts.values,
@@ -331,18 +373,18 @@ with tab2:
             color_continuous_scale='Rainbow'
         )
         fig_cast.update_layout(xaxis_title="Number of Appearances", yaxis_title="Actor/Actress")
-        st.plotly_chart(fig_cast, use_container_width=True)
+        st.plotly_chart(fig_cast, use_container_width=True, key="fig_cast")
 
-with tab3:
+with tab2:
+    render_genres()
+
+@st.fragment
+def render_geography():
     st.markdown("### Geographical Distribution")
     
     # Country analysis
-    all_countries = []
-    for countries in filtered_df['country'].dropna():
-        if countries != 'Unknown':
-            all_countries.extend([country.strip() for country in countries.split(',')])
-    
-    country_counts = pd.Series(all_countries).value_counts().head(20)
+    country_table = compute_country_table(filter_key, filtered_df)
+    country_counts = compute_country_counts(filter_key, filtered_df)
     
     col1, col2 = st.columns(2)
     
@@ -356,7 +398,7 @@ with tab3:
             color_continuous_scale='Earth'
         )
         fig_countries.update_layout(xaxis_title="Count", yaxis_title="Country")
-        st.plotly_chart(fig_countries, use_container_width=True)
+        st.plotly_chart(fig_countries, use_container_width=True, key="fig_countries")
     
     with col2:
         # World map visualization
@@ -378,7 +420,7 @@ with tab3:
                 hover_data={'count': True}
             )
             fig_world.update_layout(geo=dict(showframe=False, showcoastlines=False))
-            st.plotly_chart(fig_world, use_container_width=True)
+            st.plotly_chart(fig_world, use_container_width=True, key="fig_world")
         except Exception as e:
             st.info("Map visualization might not display correctly for some country names.")
     
@@ -386,20 +428,16 @@ with tab3:
     st.markdown("### Country vs Rating Analysis")
     
     # Prepare data for bubble chart
-    country_rating_data = []
-    for country in country_counts.head(15).index:
-        country_data = filtered_df[filtered_df['country'].str.contains(country, na=False)]
-        rating_counts_country = country_data['rating'].value_counts().head(5)
-        for rating, count in rating_counts_country.items():
-            country_rating_data.append({
-                'country': country,
-                'rating': rating,
-                'count': count
-            })
-    
-    if country_rating_data:
-        country_rating_df = pd.DataFrame(country_rating_data)
-        
+    top15_countries = country_counts.head(15).index
+    country_rating_df = (
+        country_table[country_table['country'].isin(top15_countries)]
+        .groupby(['country', 'rating'], observed=True).size()
+        .reset_index(name='count')
+        .sort_values('count', ascending=False)
+        .groupby('country').head(5)  # Top 5 ratings per country
+    )
+    
+    if not country_rating_df.empty:
         fig_bubble = px.scatter(
             country_rating_df,
             x='country',
@@ -408,23 +446,24 @@ with tab3:
             color='count',
             title="Rating Distribution by Country (Bubble Chart)",
             size_max=50,
-            color_continuous_scale='Viridis'
+            color_continuous_scale='Viridis',
+            category_orders={'country': list(top15_countries)}
         )
         fig_bubble.update_layout(xaxis_title="Country", yaxis_title="Rating")
-        st.plotly_chart(fig_bubble, use_container_width=True)
+        st.plotly_chart(fig_bubble, use_container_width=True, key="fig_bubble")
     
     # Content by country and type
     st.markdown("### Content Type Distribution by Top Countries")
     top_countries = country_counts.head(10).index
-    country_type_data = []
-    
-    for country in top_countries:
-        country_data = filtered_df[filtered_df['country'].str.contains(country, na=False)]
-        movies_count = len(country_data[country_data['type'] == 'Movie'])
-        tv_count = len(country_data[country_data['type'] == 'TV Show'])
-        country_type_data.append({'country': country, 'Movies': movies_count, 'TV Shows': tv_count})
-    
-    country_type_df = pd.DataFrame(country_type_data)
+    country_type_df = (
+        country_table[country_table['country'].isin(top_countries)]
+        .groupby(['country', 'type'], observed=True).size()
+        .unstack(fill_value=0)
+        .reindex(index=top_countries, columns=['Movie', 'TV Show'], fill_value=0)
+        .rename(columns={'Movie': 'Movies', 'TV Show': 'TV Shows'})
+        .rename_axis(index='country', columns=None)
+        .reset_index()
+    )
     country_type_df = country_type_df.melt(id_vars=['country'], var_name='Type', value_name='Count')
     
     fig_country_type = px.bar(
@@ -436,15 +475,23 @@ with tab3:
         barmode='group',
         color_discrete_map={'Movies': '#E50914', 'TV Shows': '#221F1F'}
     )
-    st.plotly_chart(fig_country_type, use_container_width=True)
+    st.plotly_chart(fig_country_type, use_container_width=True, key="fig_country_type")
 
-with tab4:
+with tab3:
+    render_geography()
+
+@st.fragment
+def render_trends():
     st.markdown("### Trends Over Time")
     
     # Release trends
     yearly_releases = filtered_df['release_year'].value_counts().sort_index()
     yearly_releases = yearly_releases[yearly_releases.index >= 1990]  # Focus on recent decades
     
+    # Month x year added counts, factorized once and shared by the yearly,
+    # heatmap and monthly views below
+    added_counts = count_matrix(filtered_df['month_added'], filtered_df['year_added'])
+    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -456,12 +503,12 @@ with tab4:
         )
         fig_yearly.update_layout(xaxis_title="Release Year", yaxis_title="Number of Titles")
         fig_yearly.update_traces(line=dict(color='#E50914', width=3))
-        st.plotly_chart(fig_yearly, use_container_width=True)
+        st.plotly_chart(fig_yearly, use_container_width=True, key="fig_yearly")
     
     with col2:
         # Content added to Netflix over time
         if 'year_added' in filtered_df.columns:
-            yearly_added = filtered_df['year_added'].value_counts().sort_index()
+            yearly_added = added_counts.sum(axis=0)
             fig_added = px.area(
                 x=yearly_added.index,
                 y=yearly_added.values,
@@ -469,36 +516,32 @@ with tab4:
             )
             fig_added.update_layout(xaxis_title="Year Added", yaxis_title="Number of Titles")
             fig_added.update_traces(fillcolor='rgba(229, 9, 20, 0.3)', line=dict(color='#E50914'))
-            st.plotly_chart(fig_added, use_container_width=True)
+            st.plotly_chart(fig_added, use_container_width=True, key="fig_added")
     
     # New: Heatmap for monthly additions
     st.markdown("### Monthly Addition Patterns")
     
     if all(col in filtered_df.columns for col in ['year_added', 'month_added']):
-        # Create heatmap data
-        heatmap_data = filtered_df.groupby(['year_added', 'month_added']).size().reset_index(name='count')
-        heatmap_pivot = heatmap_data.pivot(index='month_added', columns='year_added', values='count').fillna(0)
-        
         fig_heatmap = px.imshow(
-            heatmap_pivot,
+            added_counts,
             title="Monthly Content Additions Heatmap",
             color_continuous_scale='Reds',
             aspect='auto'
         )
         fig_heatmap.update_layout(xaxis_title="Year", yaxis_title="Month")
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.plotly_chart(fig_heatmap, use_container_width=True, key="fig_heatmap")
     
     # Monthly analysis
     st.markdown("### Monthly Distribution")
     
     if 'month_added' in filtered_df.columns:
-        monthly_added = filtered_df['month_added'].value_counts().sort_index()
+        monthly_added = added_counts.sum(axis=1)
         month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         
         monthly_data = pd.DataFrame({
             'month': month_names,
-            'count': [monthly_added.get(i, 0) for i in range(1, 13)]
+            'count': monthly_added.reindex(np.arange(1, 13), fill_value=0).to_numpy()
         })
         
         col1, col2 = st.columns(2)
@@ -512,7 +555,7 @@ with tab4:
                 color='count',
                 color_continuous_scale='Viridis'
             )
-            st.plotly_chart(fig_monthly, use_container_width=True)
+            st.plotly_chart(fig_monthly, use_container_width=True, key="fig_monthly")
         
         with col2:
             # Polar chart for monthly distribution
@@ -524,9 +567,13 @@ with tab4:
                 title="Monthly Distribution (Polar Chart)"
             )
             fig_polar.update_traces(fill='toself')
-            st.plotly_chart(fig_polar, use_container_width=True)
+            st.plotly_chart(fig_polar, use_container_width=True, key="fig_polar")
 
-with tab5:
+with tab4:
+    render_trends()
+
+@st.fragment
+def render_details():
     st.markdown("### Detailed Data Exploration")
     
     # Search and filter
@@ -536,65 +583,99 @@ with tab5:
         search_query = st.text_input("🔍 Search titles:", placeholder="Enter title, director, or cast...")
     
     with col2:
-        selected_genre = st.selectbox("Filter by genre:", ["All"] + list(df['listed_in'].str.split(',').explode().str.strip().unique())[:50])
+        selected_genre = st.selectbox("Filter by genre:", ["All"] + unique_genres())
     
     with col3:
-        selected_country = st.selectbox("Filter by country:", ["All"] + list(df['country'].str.split(',').explode().str.strip().unique())[:50])
+        selected_country = st.selectbox("Filter by country:", ["All"] + unique_countries())
     
     # Apply search filter
     detailed_df = filtered_df.copy()
     if search_query:
         detailed_df = detailed_df[
-            detailed_df['title'].str.contains(search_query, case=False, na=False) |
-            detailed_df['director'].str.contains(search_query, case=False, na=False) |
-            detailed_df['cast'].str.contains(search_query, case=False, na=False)
+            detailed_df['title'].str.contains(search_query, case=False, na=False, regex=False) |
+            detailed_df['director'].str.contains(search_query, case=False, na=False, regex=False) |
+            detailed_df['cast'].str.contains(search_query, case=False, na=False, regex=False)
         ]
     
     if selected_genre != "All":
-        detailed_df = detailed_df[detailed_df['listed_in'].str.contains(selected_genre, na=False)]
+        detailed_df = detailed_df[detailed_df['listed_in'].str.contains(selected_genre, na=False, regex=False)]
     
     if selected_country != "All":
-        detailed_df = detailed_df[detailed_df['country'].str.contains(selected_country, na=False)]
+        detailed_df = detailed_df[detailed_df['country'].str.contains(selected_country, na=False, regex=False)]
     
     # Show statistics
+    detailed_movies = int((detailed_df['type'] == 'Movie').sum())
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Filtered Results", len(detailed_df))
     with col2:
         st.metric("Average Release Year", int(detailed_df['release_year'].mean()) if not detailed_df.empty else 0)
     with col3:
-        st.metric("Movies", len(detailed_df[detailed_df['type'] == 'Movie']))
+        st.metric("Movies", detailed_movies)
     with col4:
-        st.metric("TV Shows", len(detailed_df[detailed_df['type'] == 'TV Show']))
+        st.metric("TV Shows", len(detailed_df) - detailed_movies)
     
     # Show detailed data
     st.markdown(f"**Displaying {len(detailed_df)} titles**")
     
-    # Display as expandable cards
-    for idx, row in detailed_df.head(100).iterrows():
-        with st.expander(f"🎬 {row['title']} ({row['release_year']}) - {row['type']}"):
-            col1, col2 = st.columns([1, 3])
-            
-            with col1:
-                st.markdown(f"**Type:** {row['type']}")
-                if row['type'] == 'Movie':
-                    st.markdown(f"**Duration:** {row['duration']}")
-                else:
-                    st.markdown(f"**Seasons:** {row['duration']}")
-                st.markdown(f"**Rating:** {row['rating']}")
-                st.markdown(f"**Release Year:** {row['release_year']}")
-                if pd.notna(row['date_added']):
-                    st.markdown(f"**Added on:** {row['date_added'].strftime('%Y-%m-%d')}")
-            
-            with col2:
-                st.markdown(f"**Country:** {row['country']}")
-                if pd.notna(row['director']) and row['director'] != 'Unknown':
-                    st.markdown(f"**Director:** {row['director']}")
-                if pd.notna(row['cast']) and row['cast'] != 'Unknown':
-                    st.markdown(f"**Cast:** {row['cast'][:200]}...")
-                st.markdown(f"**Genre:** {row['listed_in']}")
-                if pd.notna(row['description']):
-                    st.markdown(f"**Description:** {row['description']}")
+    # Display as a single table instead of one expander per title
+    display_columns = ['title', 'release_year', 'type', 'rating', 'duration',
+                       'country', 'director', 'cast', 'listed_in', 'description']
+    display_df = detailed_df.head(100)
+    table = st.dataframe(
+        display_df[display_columns],
+        use_container_width=True,
+        hide_index=True,
+        key="detail_table",
+        on_select="rerun",
+        selection_mode="single-row",
+        column_config={
+            'title': 'Title',
+            'release_year': st.column_config.NumberColumn('Release Year', format='%d'),
+            'type': 'Type',
+            'rating': 'Rating',
+            'duration': 'Duration',
+            'country': 'Country',
+            'director': 'Director',
+            'cast': 'Cast',
+            'listed_in': 'Genre',
+            'description': 'Description'
+        }
+    )
+    
+    # Detail panel for the selected table row
+    selected_rows = table.selection.rows
+    if not selected_rows:
+        st.caption("Select a row in the table to see the title's details.")
+    else:
+        row = display_df.iloc[selected_rows[0]]
+        st.markdown(f"#### 🎬 {row['title']} ({row['release_year']}) - {row['type']}")
+        
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            st.markdown(f"**Type:** {row['type']}")
+            if row['type'] == 'Movie':
+                st.markdown(f"**Duration:** {row['duration']}")
+            else:
+                st.markdown(f"**Seasons:** {row['duration']}")
+            st.markdown(f"**Rating:** {row['rating']}")
+            st.markdown(f"**Release Year:** {row['release_year']}")
+            if pd.notna(row['date_added']):
+                st.markdown(f"**Added on:** {row['date_added'].strftime('%Y-%m-%d')}")
+        
+        with col2:
+            st.markdown(f"**Country:** {row['country']}")
+            if pd.notna(row['director']) and row['director'] != 'Unknown':
+                st.markdown(f"**Director:** {row['director']}")
+            if pd.notna(row['cast']) and row['cast'] != 'Unknown':
+                st.markdown(f"**Cast:** {row['cast'][:200]}...")
+            st.markdown(f"**Genre:** {row['listed_in']}")
+            if pd.notna(row['description']):
+                st.markdown(f"**Description:** {row['description']}")
+
+with tab5:
+    render_details()
 
 # Footer
 st.markdown("""
@@ -0,0 +1,8 @@
+"""
+Regenerate netflix_titles.parquet from netflix_titles.csv
+"""
+from utils.helpers import convert_to_parquet
+
+if __name__ == "__main__":
+    df = convert_to_parquet()
+    print(f"Wrote netflix_titles.parquet ({len(df)} titles)")
@@ -1,7 +1,12 @@
 import pandas as pd
 import numpy as np
+import polars as pl
 from datetime import datetime
 
+# Raw CSV columns the dashboard needs; anything else in the file is skipped at load
+CSV_COLUMNS = ['show_id', 'type', 'title', 'director', 'cast', 'country', 'date_added',
+               'release_year', 'rating', 'duration', 'listed_in', 'description']
+
 def clean_netflix_data(df):
     """
     Clean and preprocess Netflix dataset
@@ -26,18 +31,81 @@ def clean_netflix_data(df):
     
     return df_clean
 
+def load_netflix_csv(path="netflix_titles.csv"):
+    """
+    Read the raw Netflix CSV and apply the cleaning used by the dashboard
+    """
+    # Parse and clean with Polars' multi-threaded reader, then hand over to pandas
+    lf = pl.scan_csv(path, schema_overrides={'release_year': pl.Int16}).select(CSV_COLUMNS)
+    lf = lf.with_columns(
+        pl.col('date_added').str.strip_chars().str.strptime(pl.Datetime, '%B %d, %Y', strict=False),
+        pl.col('country').fill_null('Unknown'),
+        pl.col('rating').fill_null('Not Rated'),
+        pl.col('duration').fill_null('Unknown')
+    )
+    lf = lf.with_columns(
+        pl.col('date_added').dt.year().cast(pl.Int16).alias('year_added'),
+        pl.col('date_added').dt.month().cast(pl.Int8).alias('month_added'),
+        ((pl.col('release_year') // 10) * 10).alias('decade'),
+        # Minutes for movies, seasons for TV shows
+        pl.col('duration').str.extract(r'(\d+)', 1).cast(pl.Int16).alias('duration_num')
+    )
+    df = lf.collect().to_pandas()
+    
+    # Nullable narrow ints; to_pandas() widens null-holding int columns to float64
+    df['year_added'] = df['year_added'].astype('Int16')
+    df['month_added'] = df['month_added'].astype('Int8')
+    df['decade'] = df['decade'].astype('Int16')
+    df['duration_num'] = df['duration_num'].astype('Int16')
+    
+    # Low-cardinality columns as categoricals so filters compare int codes
+    for col in ['type', 'rating']:
+        df[col] = df[col].astype('category')
+    
+    return df
+
+def convert_to_parquet(csv_path="netflix_titles.csv", parquet_path="netflix_titles.parquet"):
+    """
+    Write the cleaned dataset to Parquet so the app can skip CSV parsing and cleaning
+    """
+    df = load_netflix_csv(csv_path)
+    df.to_parquet(parquet_path, index=False)
+    return df
+
+def split_items(series, sep=','):
+    """
+    Split a series of separated values into one stripped item per row
+    """
+    items = series.dropna()
+    # Text columns are split as-is; only non-string data pays for the str conversion
+    if not pd.api.types.is_string_dtype(items):
+        items = items.astype(str)
+    return items.str.split(sep, regex=False).explode().str.strip()
+
 def extract_top_items(series, top_n=10, sep=','):
     """
     Extract top items from a series containing comma-separated values
     """
-    all_items = []
-    for items in series.dropna():
-        if sep in str(items):
-            all_items.extend([item.strip() for item in str(items).split(sep)])
-        else:
-            all_items.append(str(items).strip())
+    return split_items(series, sep).value_counts().head(top_n)
+
+def count_matrix(row_keys, col_keys):
+    """
+    Count rows per (row_key, col_key) pair as a wide table using one
+    factorization and np.bincount instead of a pandas groupby/crosstab
+    """
+    row_codes, row_values = pd.factorize(row_keys, sort=True)
+    col_codes, col_values = pd.factorize(col_keys, sort=True)
+    
+    # Missing keys factorize to -1 and are left out, like groupby does
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    n_rows, n_cols = len(row_values), len(col_values)
+    counts = np.bincount(row_codes[valid] * n_cols + col_codes[valid], minlength=n_rows * n_cols)
     
-    return pd.Series(all_items).value_counts().head(top_n)
+    return pd.DataFrame(
+        counts.reshape(n_rows, n_cols),
+        index=pd.Index(np.asarray(row_values), name=getattr(row_keys, 'name', None)),
+        columns=pd.Index(np.asarray(col_values), name=getattr(col_keys, 'name', None))
+    )
 
 def calculate_content_trends(df, year_col='release_year'):
     """
@@ -51,15 +119,7 @@ def get_country_stats(df, country_col='country'):
     Get statistics by country
     """
     country_stats = {}
-    all_countries = []
-    
-    for countries in df[country_col].dropna():
-        if ',' in str(countries):
-            all_countries.extend([country.strip() for country in str(countries).split(',')])
-        else:
-            all_countries.append(str(countries).strip())
-    
-    country_series = pd.Series(all_countries)
+    country_series = split_items(df[country_col])
     country_stats['counts'] = country_series.value_counts()
     country_stats['total_unique'] = country_series.nunique()
     